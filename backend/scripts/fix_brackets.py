@@ -15,7 +15,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.database import get_session_context
 from src.models import Fencer, Ranking
-from src.ranking import calculate_age, eligible_brackets
+from sqlalchemy import select
+from datetime import date
+import numpy as np
 import pandas as pd
 
 def fix_all_fencer_brackets():
@@ -35,10 +37,10 @@ def fix_all_fencer_brackets():
     print()
     
     with get_session_context() as session:
-        # Get all fencers
-        fencers = session.query(Fencer).all()
-        print(f"Found {len(fencers)} fencers to process.\n")
-        
+        # Count fencers up front; the actual rows are streamed below
+        fencer_count = session.query(Fencer).count()
+        print(f"Found {fencer_count} fencers to process.\n")
+
         bracket_counts = {
             "U11": 0,
             "U13": 0,
@@ -47,41 +49,44 @@ def fix_all_fencer_brackets():
             "Junior": 0,
             "Senior": 0
         }
-        
+
         # First, delete all existing rankings
+        # (No commit here: get_session_context commits once on exit, so the
+        # delete and re-insert happen in one atomic transaction.)
         print("Deleting all existing rankings...")
         session.query(Ranking).delete()
-        session.commit()
         print("✓ All old rankings deleted\n")
-        
-        # Process each fencer to create new rankings
-        for i, fencer in enumerate(fencers):
-            # Recalculate age and get correct bracket
-            age = calculate_age(fencer.dob)
-            brackets = eligible_brackets(age)
-            
-            if brackets:
-                bracket_name = brackets[0]
-                
-                # Create new ranking for the correct bracket
-                new_ranking = Ranking(
-                    fencer_id=fencer.fencer_id,
-                    bracket_name=bracket_name,
-                    points=0  # Reset points to 0 (you can modify to preserve old points if needed)
-                )
-                session.add(new_ranking)
-                
+
+        # Fetch just (fencer_id, dob) tuples, compute all ages in one
+        # vectorized NumPy operation, and bucket them with pd.cut - no
+        # per-fencer Python date arithmetic.
+        new_rankings = []
+        rows = session.execute(select(Fencer.fencer_id, Fencer.dob)).all()
+        if rows:
+            ids, dobs = zip(*rows)
+            ages = (np.datetime64(date.today()) -
+                    np.array(dobs, dtype='datetime64[D]')).astype(int) // 365
+            brackets = pd.cut(
+                ages,
+                bins=[-1, 10, 12, 14, 16, 19, 200],
+                labels=["U11", "U13", "U15", "Cadet", "Junior", "Senior"]
+            )
+
+            for fencer_id, age, bracket_name in zip(ids, ages, brackets):
+                if pd.isna(bracket_name):
+                    print(f"Warning: No bracket found for fencer {fencer_id} (age {age})")
+                    continue
+                new_rankings.append({
+                    "fencer_id": fencer_id,
+                    "bracket_name": str(bracket_name),
+                    "points": 0  # Reset points to 0 (you can modify to preserve old points if needed)
+                })
                 bracket_counts[bracket_name] = bracket_counts.get(bracket_name, 0) + 1
-                
-                if (i + 1) % 100 == 0:
-                    print(f"Processed {i + 1}/{len(fencers)} fencers...")
-            else:
-                print(f"Warning: No bracket found for fencer {fencer.fencer_id} (age {age})")
-        
-        # Commit all changes
-        session.commit()
-        
-        print(f"\n✓ Processed {len(fencers)} fencers")
+
+        # One bulk insert; the session context commits on exit
+        session.bulk_insert_mappings(Ranking, new_rankings)
+
+        print(f"\n✓ Processed {fencer_count} fencers")
         print("\nBracket Distribution:")
         for bracket, count in bracket_counts.items():
             print(f"  {bracket:8s}: {count:4d} fencers")
@@ -24,7 +24,10 @@ DATABASE_URL = os.getenv('DATABASE_URL')
 if not DATABASE_URL:
     # SQLite fallback for local development
     db_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'database')
-    os.makedirs(db_dir, exist_ok=True)
+    # Only touch the filesystem when the directory is actually missing;
+    # this module is imported by every script
+    if not os.path.isdir(db_dir):
+        os.makedirs(db_dir, exist_ok=True)
     db_path = os.path.join(db_dir, 'fencing_management.db')
     DATABASE_URL = f"sqlite:///{db_path}"
     logger.info(f"Using SQLite database at {db_path}")
@@ -40,11 +43,13 @@ is_sqlite = 'sqlite' in DATABASE_URL
 # Create the database engine
 # Different settings for SQLite vs PostgreSQL
 if is_sqlite:
+    # StaticPool keeps a single cached connection per process, so the
+    # connect-time PRAGMAs run once instead of per session
     engine = create_engine(
         DATABASE_URL,
         echo=False,
         future=True,
-        connect_args={"check_same_thread": False},
+        connect_args={"check_same_thread": False, "timeout": 30},
         poolclass=StaticPool,
     )
 else:
@@ -59,17 +64,30 @@ else:
     )
 
 # Enable SQLite foreign keys (important for referential integrity)
+# and tune journaling for the bulk-write scripts (fix_brackets, migrations).
+# The test scripts share this engine, so their many small commits get the
+# same WAL treatment - a log append instead of a full-journal fsync each
 if is_sqlite:
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
-        """Enable foreign key constraints for SQLite"""
+        """Enable foreign key constraints and write-performance PRAGMAs for SQLite"""
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        # WAL avoids an fsync per commit; NORMAL sync is safe with WAL
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        # 64 MB page cache, in-memory temp tables, 256 MB mmap window
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
         cursor.close()
 
 # Session factory - creates new database sessions
 # autocommit=False means changes must be explicitly committed
-# autoflush=True means SQLAlchemy automatically flushes changes before queries
+# autoflush=False means queries don't re-scan the dirty set before every
+# SELECT - read-heavy blocks (e.g. post-ingest verification) skip that
+# per-query flush tax, at the cost of having to flush() explicitly before
+# reading back uncommitted writes
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -77,20 +95,31 @@ SessionLocal = sessionmaker(
 )
 
 
+# Set once init_db has run in this process, so repeated calls (every test
+# function calls it defensively) skip the CREATE TABLE round-trips - and,
+# on Postgres, the locks they take
+_initialized = False
+
+
 def init_db():
     """
     Initialize the database by creating all tables.
-    
+
     This function creates all tables defined in the models (Fencer, Club, Ranking).
     If tables already exist, this does nothing (won't delete existing data).
-    
+
     Call this once at the start of your application or when setting up a new database.
+    Repeated calls in the same process return immediately.
     """
+    global _initialized
+    if _initialized:
+        return
     try:
         # Create all tables defined in Base (all our models)
         Base.metadata.create_all(bind=engine)
         db_location = DATABASE_URL if not is_sqlite else db_path
         logger.info(f"Database initialized successfully at {db_location}")
+        _initialized = True
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
         raise
@@ -157,15 +186,18 @@ def reset_db():
     Drop all tables and recreate them from scratch.
     Only use this during development/testing, never in production!
     """
+    global _initialized
     try:
         logger.warning("Dropping all database tables...")
         # Drop all tables
         Base.metadata.drop_all(bind=engine)
         logger.info("All tables dropped.")
-        
+
         # Recreate all tables
         Base.metadata.create_all(bind=engine)
         logger.info("All tables recreated.")
+        # Tables exist again, so later init_db() calls can stay no-ops
+        _initialized = True
     except Exception as e:
         logger.error(f"Error resetting database: {e}")
         raise
@@ -5,17 +5,165 @@ This module provides functions to load data from CSV files and populate
 the database with Fencer, Club, and Ranking records.
 """
 
+import io
+import os
+import numpy as np
 import pandas as pd
-from sqlalchemy.orm import Session
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from .models import Fencer, Club, Ranking
 from .database import get_session_context
-from .enums import Gender
+from .enums import Gender, WeaponType
+from .ranking import AGE_BRACKETS
+from datetime import date
 from .decorators import with_session, batch_operation
 from typing import Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bin edges for vectorized bracket assignment with pd.cut, derived from
+# AGE_BRACKETS. Left edges are exclusive, so -1 admits age 0; the last
+# bin is stretched to 200 because Senior has no real upper limit.
+_BRACKET_BINS = [-1] + [max_age for _, _, max_age in AGE_BRACKETS[:-1]] + [200]
+_BRACKET_LABELS = [name for name, _, _ in AGE_BRACKETS]
+
+
+@contextmanager
+def sqlite_bulk_mode(session: Session):
+    """
+    Relax SQLite settings for the duration of a known-clean bulk ingest.
+
+    journal_mode/synchronous/temp_store are already tuned at connect time
+    in database.py; on top of that this disables per-insert foreign-key
+    checks and enlarges the page cache to ~200 MB while the ingest runs,
+    restoring both afterwards (even on error). The ingest itself is
+    committed only if the block succeeds; on error it's rolled back like
+    any other session work. Only use it when the CSV is trusted - FK
+    violations slip through while checks are off.
+
+    No-op on non-SQLite backends.
+
+    Example:
+        with sqlite_bulk_mode(session):
+            ingest_fencers_from_csv(path, session=session)
+    """
+    if session.bind.dialect.name != "sqlite":
+        yield session
+        return
+
+    # PRAGMA foreign_keys is ignored inside an open transaction, so make
+    # sure none is pending before issuing it
+    session.commit()
+    session.execute(text("PRAGMA foreign_keys=OFF"))
+    session.execute(text("PRAGMA cache_size=-200000"))
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        # Don't make a half-finished ingest durable - roll it back, the
+        # same way get_session_context treats any failed block
+        session.rollback()
+        raise
+    finally:
+        session.execute(text("PRAGMA cache_size=-65536"))
+        session.execute(text("PRAGMA foreign_keys=ON"))
+
+
+@contextmanager
+def bulk_ingest_mode(session: Session, num_rows: int):
+    """
+    Temporarily drop secondary indexes around a large fencer ingest.
+
+    Inserting 100k+ rows pays incremental b-tree maintenance on every
+    secondary index (club_id, weapon/gender, bracket/points, ...).
+    Dropping the non-unique indexes up front and recreating them after
+    the load replaces N incremental updates with one bulk sort per index.
+
+    Only kicks in above 10k rows - below that the rebuild costs more
+    than it saves. Unique indexes and primary keys are left in place
+    since they enforce integrity during the load. Indexes are rebuilt
+    even if the ingest raises.
+
+    Args:
+        session: Active database session
+        num_rows: Expected number of rows in the ingest, used as the guard
+
+    Example:
+        with bulk_ingest_mode(session, num_rows=500_000):
+            ingest_fencers_from_csv(path, session=session)
+    """
+    dropped = []
+    if num_rows > 10_000:
+        for table in (Fencer.__table__, Ranking.__table__):
+            for ix in table.indexes:
+                if not ix.unique:
+                    ix.drop(bind=session.bind)
+                    dropped.append(ix)
+        logger.info(f"Dropped {len(dropped)} secondary indexes for bulk ingest")
+    try:
+        yield session
+    finally:
+        for ix in dropped:
+            ix.create(bind=session.bind)
+        if dropped:
+            logger.info(f"Rebuilt {len(dropped)} secondary indexes after bulk ingest")
+
+
+def _copy_rows_postgres(session: Session, table, rows, conflict_target: str):
+    """
+    Bulk-load row dicts into a table using Postgres COPY FROM STDIN.
+
+    Streams the rows as CSV into a temporary staging table via the raw
+    DBAPI cursor's copy_expert, then moves them into the real table with
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING. COPY is bandwidth-limited
+    rather than query-limited, so this beats even executemany INSERTs by a
+    wide margin on large imports. Postgres-only; callers must check the
+    dialect and keep the plain INSERT path as the SQLite fallback.
+
+    Args:
+        session: Active database session (postgresql dialect)
+        table: SQLAlchemy Table to load into
+        rows: List of column-name -> value dicts (all with the same keys)
+        conflict_target: Column list for the ON CONFLICT clause,
+                         e.g. "fencer_id" or "fencer_id, bracket_name"
+    """
+    columns = list(rows[0].keys())
+    col_list = ", ".join(columns)
+    staging = f"staging_{table.name}"
+
+    # Serialize once into an in-memory CSV buffer
+    buf = io.StringIO()
+    pd.DataFrame(rows, columns=columns).to_csv(buf, index=False, header=False)
+    buf.seek(0)
+
+    # Temp staging table mirrors the target and vanishes at commit.
+    # Callers invoke this once per chunk inside one transaction, so
+    # ON COMMIT DROP hasn't fired yet when the next chunk arrives -
+    # drop any leftover staging table from the previous chunk first
+    session.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+    session.execute(text(
+        f"CREATE TEMP TABLE {staging} (LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+    ))
+
+    # copy_expert needs the raw psycopg cursor, not the SQLAlchemy facade
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {staging} ({col_list}) FROM STDIN WITH CSV", buf)
+    finally:
+        cursor.close()
+
+    session.execute(text(
+        f"INSERT INTO {table.name} ({col_list}) "
+        f"SELECT {col_list} FROM {staging} "
+        f"ON CONFLICT ({conflict_target}) DO NOTHING"
+    ))
+
 
 @with_session
 def ingest_fencers_from_csv(file_path: str, session: Session = None) -> Dict[int, Fencer]:
@@ -39,100 +187,203 @@ def ingest_fencers_from_csv(file_path: str, session: Session = None) -> Dict[int
         70196,Joseph,Barber,1981-11-03,1,Foil,Club_4
         54354,Marc,Velasquez,1987-10-02,1,Foil,Club_4
     """
-    # Read CSV file into pandas DataFrame
-    df = pd.read_csv(file_path)
-    logger.info(f"Loading {len(df)} fencers from {file_path}")
-    
+    # Stream the CSV in 100k-row chunks instead of loading it whole - memory
+    # stays constant regardless of file size, and each chunk's DB write
+    # overlaps with parsing the next. Pinning usecols/dtype lets the parser
+    # skip type inference and unused columns (e.g. the email/phone columns
+    # in the realistic dataset). gender stays inferred because it can be
+    # 0/1 or M/F depending on the source file.
+    reader = pd.read_csv(
+        file_path,
+        usecols=["fencer_id", "first_name", "last_name", "dob", "gender", "weapon", "club_id"],
+        dtype={"fencer_id": "int64", "first_name": str, "last_name": str,
+               "weapon": str, "club_id": str},
+        parse_dates=["dob"],
+        chunksize=100_000,
+    )
+    logger.info(f"Loading fencers from {file_path}")
+
     # Dictionary to store created fencers (for return value)
     fencers_dict = {}
-    
+
     # Dictionary to track which clubs we've already created in this session
-    # Prevents duplicate club creation
+    # Prevents duplicate club creation. Persists across chunks.
     clubs_created = {}
-    
+
     # Set to track fencer IDs we've already processed in this batch
-    # This prevents duplicates within the same transaction
+    # This prevents duplicates within the same transaction (and across chunks)
     fencers_in_batch = set()
-    
-    # Iterate through each row in the CSV
-    for index, row in df.iterrows():
-        # Extract data from row
-        fencer_id = int(row["fencer_id"])
-        
-        # Skip if we've already processed this fencer in this batch
-        # This prevents duplicate inserts within the same transaction
-        if fencer_id in fencers_in_batch:
-            continue
-        
-        first_name = str(row["first_name"])
-        last_name = str(row["last_name"])
-        dob = row["dob"]  # Will be converted to date in Fencer.__init__
-        gender = row["gender"]
-        weapon = str(row["weapon"])
-        club_id = str(row["club_id"]) if pd.notna(row["club_id"]) else None
-        
-        # Check if club exists in database, if not create it
-        if club_id and club_id not in clubs_created:
-            # Check if club already exists in database
-            existing_club = session.query(Club).filter_by(club_id=club_id).first()
-            
-            if existing_club is None:
-                # Create new club with minimal information
-                # You can enhance this later to read club details from a separate CSV
-                club = Club(
-                    club_id=club_id,
-                    club_name=club_id,  # Using club_id as name if no other info available
-                    status="Active"
+
+    # fencer_ids inserted by this call, reloaded as ORM objects at the end
+    new_ids = []
+    weapon_values = set(WeaponType.values())
+    is_postgres = session.bind.dialect.name == "postgresql"
+
+    try:
+        for df in reader:
+            # Preload which clubs and fencers from this chunk already exist
+            # with a few bulk IN queries instead of one SELECT per CSV row
+            # (the classic N+1 pattern). IN lists are chunked to stay under
+            # backend parameter limits.
+            csv_club_ids = [c for c in set(df["club_id"].dropna().astype(str))
+                            if c not in clubs_created]
+            existing_club_ids = set()
+            for i in range(0, len(csv_club_ids), 1000):
+                chunk = csv_club_ids[i:i + 1000]
+                existing_club_ids.update(
+                    club_id for (club_id,) in session.query(Club.club_id).filter(Club.club_id.in_(chunk))
                 )
-                session.add(club)
-                clubs_created[club_id] = club
-                logger.debug(f"Created new club: {club_id}")
-            else:
-                clubs_created[club_id] = existing_club
-        
-        # Check if fencer already exists in database
-        # Note: This won't see fencers added in the current session that haven't been committed yet
-        # That's why we also check fencers_in_batch above
-        existing_fencer = session.query(Fencer).filter_by(fencer_id=fencer_id).first()
-        
-        if existing_fencer is None:
-            try:
-                # Create new Fencer object
-                # The __init__ method automatically:
-                # - Converts dob to date format
-                # - Normalizes gender (0/1 -> F/M)
-                # - Calls assign_rankings_from_dob() to create Ranking entries
-                fencer = Fencer(
-                    fencer_id=fencer_id,
-                    first_name=first_name,
-                    last_name=last_name,
-                    dob=dob,
-                    gender=gender,
-                    weapon=weapon,
-                    club_id=club_id
+
+            csv_fencer_ids = [int(fid) for fid in df["fencer_id"].unique()
+                              if int(fid) not in fencers_in_batch]
+            existing_fencers = {}
+            for i in range(0, len(csv_fencer_ids), 1000):
+                chunk = csv_fencer_ids[i:i + 1000]
+                existing_fencers.update(
+                    (f.fencer_id, f) for f in session.query(Fencer).filter(Fencer.fencer_id.in_(chunk))
                 )
-                
-                # Add to session (not yet saved to database)
-                session.add(fencer)
-                
-                # Mark as processed in this batch
-                fencers_in_batch.add(fencer_id)
-                fencers_dict[fencer_id] = fencer
-            except Exception as e:
-                # If there's an error (e.g., duplicate constraint), skip this fencer
-                logger.warning(f"Error creating fencer {fencer_id}: {e}. Skipping...")
-                continue
-        else:
-            # Fencer already exists in database, use existing one
-            fencers_in_batch.add(fencer_id)  # Mark as processed
-            fencers_dict[fencer_id] = existing_fencer
-            if len(fencers_dict) % 100 == 0:  # Only log every 100 to avoid spam
-                logger.debug(f"Processed {len(fencers_dict)} fencers...")
-    
-    # Commit all changes to database
-    # This is when all the INSERT statements are actually executed
-    try:
+
+            # Extract each column once as a plain array instead of boxing
+            # every row into a Series with iterrows() - the per-row overhead
+            # dominates on large CSVs. Dates are parsed in one vectorized pass.
+            ids = df["fencer_id"].to_numpy()
+            first_names = df["first_name"].to_numpy(dtype=object)
+            last_names = df["last_name"].to_numpy(dtype=object)
+            dobs = df["dob"].dt.date.to_numpy()
+            genders = df["gender"].to_numpy()
+            weapons = df["weapon"].to_numpy(dtype=object)
+            club_ids = df["club_id"].to_numpy(dtype=object)
+            has_club = df["club_id"].notna().to_numpy()
+
+            # Vectorized bracket assignment: birthday-aware ages for the
+            # whole chunk in a few array ops, bucketed with pd.cut, instead
+            # of calling calculate_age + eligible_brackets per row. Ages
+            # out of range (negative) come back NaN and get no ranking,
+            # matching eligible_brackets returning [].
+            today = date.today()
+            ages = (today.year - df["dob"].dt.year
+                    - ((df["dob"].dt.month > today.month)
+                       | ((df["dob"].dt.month == today.month)
+                          & (df["dob"].dt.day > today.day))))
+            bracket_labels = pd.cut(
+                ages, bins=_BRACKET_BINS, labels=_BRACKET_LABELS
+            ).astype(object).to_numpy()
+
+            # Row dicts accumulated for this chunk's bulk inserts
+            fencer_rows = []
+            ranking_rows = []
+
+            # Iterate through each row in the chunk
+            for fencer_id, first_name, last_name, dob, gender, weapon, club_id, club_present, bracket in zip(
+                    ids, first_names, last_names, dobs, genders, weapons, club_ids, has_club,
+                    bracket_labels):
+                fencer_id = int(fencer_id)
+
+                # Skip if we've already processed this fencer in this batch
+                # This prevents duplicate inserts within the same transaction
+                if fencer_id in fencers_in_batch:
+                    continue
+
+                first_name = str(first_name)
+                last_name = str(last_name)
+                weapon = str(weapon)
+                club_id = str(club_id) if club_present else None
+
+                # Check if club exists (against the preloaded set), if not create it
+                if club_id and club_id not in clubs_created:
+                    if club_id not in existing_club_ids:
+                        # Create new club with minimal information
+                        # You can enhance this later to read club details from a separate CSV
+                        club = Club(
+                            club_id=club_id,
+                            club_name=club_id,  # Using club_id as name if no other info available
+                            status="Active"
+                        )
+                        session.add(club)
+                        clubs_created[club_id] = club
+                    else:
+                        clubs_created[club_id] = True
+
+                # Check if fencer already exists in database (preloaded above)
+                # Note: This won't see fencers added in the current session that haven't been committed yet
+                # That's why we also check fencers_in_batch above
+                existing_fencer = existing_fencers.get(fencer_id)
+
+                if existing_fencer is None:
+                    try:
+                        # Build plain row dicts for a Core bulk insert instead of one
+                        # ORM Fencer per row - this skips the unit-of-work machinery
+                        # (identity map, cascades) that dominates large ingests.
+                        # Gender normalization, dob validation and ranking-bracket
+                        # assignment mirror what Fencer.__init__ would do.
+                        gender_value = Gender.normalize(gender).value
+                        if weapon not in weapon_values:
+                            raise ValueError(f"Invalid weapon: {weapon}. Must be one of {WeaponType.values()}")
+                        if dob > today:
+                            raise ValueError("Date of birth cannot be in the future")
+
+                        fencer_rows.append({
+                            "fencer_id": fencer_id,
+                            "first_name": first_name,
+                            "last_name": last_name,
+                            "dob": dob,
+                            "gender": gender_value,
+                            "weapon": weapon,
+                            "club_id": club_id,
+                        })
+
+                        if isinstance(bracket, str):
+                            ranking_rows.append({
+                                "fencer_id": fencer_id,
+                                "bracket_name": bracket,
+                                "points": 0,
+                                "tournaments_attended": 0,
+                            })
+
+                        # Mark as processed in this batch
+                        fencers_in_batch.add(fencer_id)
+                    except Exception as e:
+                        # If there's an error (e.g., bad gender/weapon value), skip this fencer
+                        logger.warning(f"Error creating fencer {fencer_id}: {e}. Skipping...")
+                        continue
+                else:
+                    # Fencer already exists in database, use existing one
+                    fencers_in_batch.add(fencer_id)  # Mark as processed
+                    fencers_dict[fencer_id] = existing_fencer
+
+            # Write this chunk out before parsing the next one.
+            # Flush pending club creations first so the fencer FK targets exist.
+            session.flush()
+            if is_postgres:
+                # Postgres: stream the rows with COPY instead of INSERTs
+                if fencer_rows:
+                    _copy_rows_postgres(session, Fencer.__table__, fencer_rows, "fencer_id")
+                if ranking_rows:
+                    _copy_rows_postgres(session, Ranking.__table__, ranking_rows,
+                                        "fencer_id, bracket_name")
+            else:
+                if fencer_rows:
+                    session.execute(insert(Fencer.__table__), fencer_rows)
+                if ranking_rows:
+                    session.execute(insert(Ranking.__table__), ranking_rows)
+            new_ids.extend(row["fencer_id"] for row in fencer_rows)
+
+        # One commit for the whole file
         session.commit()
+
+        # Load the newly inserted fencers back as ORM objects so the return
+        # value keeps its fencer_id -> Fencer contract (one query per 1000)
+        for i in range(0, len(new_ids), 1000):
+            chunk = new_ids[i:i + 1000]
+            fencers_dict.update(
+                (f.fencer_id, f) for f in session.query(Fencer).filter(Fencer.fencer_id.in_(chunk))
+            )
+
+        # One summary line instead of a log call per new club - with
+        # thousands of clubs the per-row logging serializes on stdout
+        new_clubs = [cid for cid, created in clubs_created.items() if created is not True]
+        if new_clubs:
+            logger.info("Created %d new clubs", len(new_clubs))
         logger.info(f"Successfully ingested {len(fencers_dict)} fencers from CSV")
         return fencers_dict
     except Exception as e:
@@ -141,6 +392,118 @@ def ingest_fencers_from_csv(file_path: str, session: Session = None) -> Dict[int
         raise
 
 
+def _ingest_with_retry(file_path: str, session: Session) -> tuple:
+    """
+    Run ingest_fencers_from_csv with one retry on IntegrityError.
+
+    Two workers can race to create the same club; the loser's transaction
+    rolls back, and on retry the club already exists and the preload
+    picks it up.
+    """
+    try:
+        fencers = ingest_fencers_from_csv(file_path, session=session)
+    except IntegrityError:
+        session.rollback()
+        logger.warning(f"Retrying {file_path} after concurrent club creation")
+        fencers = ingest_fencers_from_csv(file_path, session=session)
+    return file_path, len(fencers)
+
+
+def _ingest_file_worker(file_path: str, use_processes: bool) -> tuple:
+    """
+    Ingest a single CSV file in a worker. Top-level so it can be pickled
+    for process pools.
+
+    Process workers (Postgres): SQLAlchemy engines are not fork-safe, so
+    the engine inherited from the parent is disposed before and after the
+    work, forcing fresh connections in the child.
+
+    Thread workers (SQLite): the module engine's StaticPool hands the
+    same connection to every thread, and concurrent sessions interleaving
+    transactions on one connection corrupt each other's state. Each
+    worker therefore opens a private single-connection engine; WAL mode
+    plus the busy timeout make multiple connections to the same database
+    file safe.
+
+    Args:
+        file_path: Path to the fencer CSV to ingest
+        use_processes: True in process workers, False in thread workers
+
+    Returns:
+        Tuple of (file_path, number of fencers ingested)
+    """
+    from . import database
+
+    if use_processes:
+        database.engine.dispose()
+        try:
+            with get_session_context() as session:
+                return _ingest_with_retry(file_path, session)
+        finally:
+            database.engine.dispose()
+
+    worker_engine = create_engine(
+        database.DATABASE_URL,
+        future=True,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(worker_engine, "connect")
+    def _worker_pragmas(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    session = sessionmaker(autocommit=False, autoflush=False, bind=worker_engine)()
+    try:
+        return _ingest_with_retry(file_path, session)
+    finally:
+        session.close()
+        worker_engine.dispose()
+
+
+def ingest_csv_batch(file_paths, workers: int = None) -> Dict[str, int]:
+    """
+    Ingest multiple fencer CSV files in parallel.
+
+    Files are independent (club dedup happens per-file against the
+    database), so they fan out over a worker pool instead of being
+    processed one at a time. Files are submitted largest-first so a big
+    file doesn't end up as the last straggler.
+
+    On Postgres each worker is a separate process with its own engine.
+    SQLite doesn't tolerate multi-process writers, so it falls back to a
+    thread pool - WAL mode and check_same_thread=False (already set in
+    database.py) make that safe.
+
+    Args:
+        file_paths: Iterable of CSV file paths to ingest
+        workers: Maximum pool size (defaults to the executor's default)
+
+    Returns:
+        Dictionary mapping each file path to the number of fencers ingested
+    """
+    from .database import is_sqlite
+
+    # Largest files first so the pool drains evenly
+    ordered = sorted(file_paths, key=os.path.getsize, reverse=True)
+    if not ordered:
+        return {}
+
+    executor_cls = ThreadPoolExecutor if is_sqlite else ProcessPoolExecutor
+    counts = {}
+    with executor_cls(max_workers=workers) as executor:
+        use_processes = not is_sqlite
+        for path, count in executor.map(_ingest_file_worker, ordered,
+                                        repeat(use_processes)):
+            counts[path] = count
+            logger.info(f"Ingested {count} fencers from {path}")
+    return counts
+
+
 def get_club_stats(session: Session = None) -> Dict:
     """
     Get statistics about clubs in the database.
@@ -198,37 +561,61 @@ def _ingest_clubs_impl(file_path: str, session: Session):
         file_path: Path to CSV file
         session: Active database session
     """
-    df = pd.read_csv(file_path)
-    
-    for index, row in df.iterrows():
-        club_id = str(row["club_id"])
-        
+    # Club CSVs only carry a subset of these columns, so resolve usecols
+    # against the header first (the pyarrow engine doesn't take callables);
+    # dtypes are pinned so the parser skips inference
+    club_columns = {"club_id", "club_name", "start_year", "status", "weapon_club"}
+    header = pd.read_csv(file_path, nrows=0).columns
+    read_kwargs = dict(
+        usecols=[c for c in header if c in club_columns],
+        dtype={"club_id": str, "club_name": str, "status": str,
+               "weapon_club": str, "start_year": "Int64"},
+    )
+    try:
+        # PyArrow's CSV reader parses in parallel; the default C engine
+        # is single-threaded
+        df = pd.read_csv(file_path, engine="pyarrow", **read_kwargs)
+    except (ImportError, ValueError):
+        df = pd.read_csv(file_path, **read_kwargs)
+
+    def column(name):
+        """Return the named column as an object array, or Nones if absent"""
+        if name in df.columns:
+            return df[name].to_numpy(dtype=object)
+        return [None] * len(df)
+
+    # Extract columns once as plain arrays instead of iterrows()
+    for club_id, club_name, start_year, status, weapon_club in zip(
+            df["club_id"].to_numpy(dtype=object), column("club_name"),
+            column("start_year"), column("status"), column("weapon_club")):
+        club_id = str(club_id)
+
         # Check if club exists
         club = session.query(Club).filter_by(club_id=club_id).first()
-        
+
         if club is None:
             # Create new club
             club = Club(
                 club_id=club_id,
-                club_name=str(row.get("club_name", club_id)),
-                start_year=int(row["start_year"]) if pd.notna(row.get("start_year")) else None,
-                status=str(row.get("status", "Active")),
-                weapon_club=str(row["weapon_club"]) if pd.notna(row.get("weapon_club")) else None
+                club_name=str(club_name) if pd.notna(club_name) else club_id,
+                start_year=int(start_year) if pd.notna(start_year) else None,
+                status=str(status) if pd.notna(status) else "Active",
+                weapon_club=str(weapon_club) if pd.notna(weapon_club) else None
             )
             session.add(club)
         else:
             # Update existing club
-            if "club_name" in row and pd.notna(row["club_name"]):
-                club.club_name = str(row["club_name"])
-            if "start_year" in row and pd.notna(row["start_year"]):
-                club.start_year = int(row["start_year"])
-            if "status" in row and pd.notna(row["status"]):
-                club.status = str(row["status"])
-            if "weapon_club" in row and pd.notna(row["weapon_club"]):
-                club.weapon_club = str(row["weapon_club"])
+            if pd.notna(club_name):
+                club.club_name = str(club_name)
+            if pd.notna(start_year):
+                club.start_year = int(start_year)
+            if pd.notna(status):
+                club.status = str(status)
+            if pd.notna(weapon_club):
+                club.weapon_club = str(weapon_club)
     
     session.commit()
-    print(f"Successfully ingested clubs from {file_path}")
+    logger.info(f"Successfully ingested clubs from {file_path}")
 
 
 def migrate_from_dict_to_db(fencers_dict: dict, session: Session = None):
@@ -258,12 +645,30 @@ def _migrate_impl(fencers_dict: dict, session: Session):
         session: Active database session
     """
     clubs_created = {}
-    
+
+    # Same N+1 fix as ingest_fencers_from_csv: preload which clubs and
+    # fencers already exist with a few chunked IN queries instead of two
+    # SELECTs per migrated fencer
+    old_club_ids = list({f.club_id for f in fencers_dict.values() if f.club_id})
+    existing_club_ids = set()
+    for i in range(0, len(old_club_ids), 1000):
+        chunk = old_club_ids[i:i + 1000]
+        existing_club_ids.update(
+            club_id for (club_id,) in session.query(Club.club_id).filter(Club.club_id.in_(chunk))
+        )
+
+    old_fencer_ids = [f.id for f in fencers_dict.values()]
+    existing_fencer_ids = set()
+    for i in range(0, len(old_fencer_ids), 1000):
+        chunk = old_fencer_ids[i:i + 1000]
+        existing_fencer_ids.update(
+            fid for (fid,) in session.query(Fencer.fencer_id).filter(Fencer.fencer_id.in_(chunk))
+        )
+
     for fencer_id, old_fencer in fencers_dict.items():
-        # Check if club exists
+        # Check if club exists (membership test against the preloads)
         if old_fencer.club_id and old_fencer.club_id not in clubs_created:
-            existing_club = session.query(Club).filter_by(club_id=old_fencer.club_id).first()
-            if existing_club is None:
+            if old_fencer.club_id not in existing_club_ids:
                 club = Club(
                     club_id=old_fencer.club_id,
                     club_name=old_fencer.club_id,
@@ -271,10 +676,9 @@ def _migrate_impl(fencers_dict: dict, session: Session):
                 )
                 session.add(club)
                 clubs_created[old_fencer.club_id] = club
-        
+
         # Check if fencer exists
-        existing_fencer = session.query(Fencer).filter_by(fencer_id=old_fencer.id).first()
-        if existing_fencer is None:
+        if old_fencer.id not in existing_fencer_ids:
             # Convert old FencerID to new Fencer model
             fencer = Fencer(
                 fencer_id=old_fencer.id,
@@ -295,4 +699,4 @@ def _migrate_impl(fencers_dict: dict, session: Session):
             session.add(fencer)
     
     session.commit()
-    print(f"Successfully migrated {len(fencers_dict)} fencers to database")
+    logger.info(f"Successfully migrated {len(fencers_dict)} fencers to database")
@@ -51,13 +51,16 @@ def eligible_brackets(age: int):
         age=18  -> ['Junior']   (18 is within 17-19)
         age=25  -> ['Senior']   (25 is within 20+)
     """
-    result = []
-    # Check each bracket to find which one(s) the age falls into
-    for name, min_age, max_age in AGE_BRACKETS:
-        # Check if age is within this bracket's range (inclusive)
-        if min_age <= age <= max_age:
-            result.append(name)
-            # A fencer should only belong to one bracket, so break after finding it
-            # (This assumes brackets don't overlap)
-            break
-    return result
\ No newline at end of file
+    if age < 0:
+        return []
+    # Clamp ages beyond the table to the top entry (Senior has no upper limit)
+    return list(_BRACKETS_BY_AGE[min(age, 99)])
+
+
+# Precomputed age -> brackets lookup, built once at import. Callers like
+# fix_brackets.py and CSV ingestion call eligible_brackets thousands of
+# times, so a tuple index beats re-scanning AGE_BRACKETS per call.
+_BRACKETS_BY_AGE = tuple(
+    tuple(name for name, min_age, max_age in AGE_BRACKETS if min_age <= a <= max_age)
+    for a in range(100)
+)
\ No newline at end of file
@@ -7,11 +7,14 @@ for fencing tournaments. It includes validation, point calculation, and CSV impo
 
 from .database import get_session_context
 from .models import Tournament, TournamentResult, Fencer, Ranking
-from .tournament_points import calculate_points
+from .tournament_points import compute_points_table
 from .ranking import calculate_age, eligible_brackets
 from .enums import WeaponType, AgeBracket, CompetitionType, TournamentStatus, Gender
 from .decorators import with_session, transactional
 from typing import Dict, List, Tuple, Optional
+from sqlalchemy import select, insert, update, bindparam, and_, literal
+from sqlalchemy.orm import selectinload
+import numpy as np
 import pandas as pd
 import logging
 
@@ -71,41 +74,73 @@ def create_tournament(tournament_name: str, date, weapon: str, bracket: str,
 
 @with_session
 def register_fencer_for_tournament(fencer_id: int, tournament_id: int,
+                                   commit: bool = True,
+                                   tournament: Tournament = None,
+                                   fencer: Fencer = None,
                                    session=None) -> Tuple[bool, str]:
     """
     Register a fencer for a tournament.
-    
+
     Validates eligibility before registering:
     - Weapon match
     - Bracket match
     - Gender match (if specified)
     - Tournament not full
     - Tournament accepts registrations
-    
+
     Args:
         fencer_id: ID of the fencer to register
         tournament_id: ID of the tournament
+        commit: If False, flush instead of committing so a caller
+                registering many fencers can batch them under one commit
+                (a commit means an fsync per registration)
+        tournament: Optional already-loaded Tournament; skips the lookup
+                    when a caller registering many fencers has it in hand
+        fencer: Optional already-loaded Fencer, same idea
         session: Optional database session
-    
+
     Returns:
         Tuple (success: bool, message: str)
     """
-    # Get tournament
-    tournament = session.query(Tournament).filter_by(tournament_id=tournament_id).first()
-    if not tournament:
-        return False, f"Tournament {tournament_id} not found"
-    
-    # Get fencer
-    fencer = session.query(Fencer).filter_by(fencer_id=fencer_id).first()
-    if not fencer:
-        return False, f"Fencer {fencer_id} not found"
-    
-    # Check if already registered
-    existing_result = session.query(TournamentResult).filter_by(
-        tournament_id=tournament_id,
-        fencer_id=fencer_id
-    ).first()
-    
+    if tournament is None and fencer is None:
+        # One SELECT instead of three: cross-join tournament and fencer
+        # (both filtered to single rows) and LEFT JOIN any existing
+        # registration, so accept/reject needs a single round-trip
+        row = session.execute(
+            select(Tournament, Fencer, TournamentResult)
+            .select_from(Tournament)
+            .join(Fencer, literal(True))
+            .outerjoin(TournamentResult, and_(
+                TournamentResult.tournament_id == Tournament.tournament_id,
+                TournamentResult.fencer_id == Fencer.fencer_id))
+            .where(Tournament.tournament_id == tournament_id,
+                   Fencer.fencer_id == fencer_id)
+        ).first()
+
+        if row is None:
+            # Cold path: work out which of the two was missing
+            if session.get(Tournament, tournament_id) is None:
+                return False, f"Tournament {tournament_id} not found"
+            return False, f"Fencer {fencer_id} not found"
+        tournament, fencer, existing_result = row
+    else:
+        # Caller passed one or both objects in - fill the gaps
+        if tournament is None:
+            tournament = session.query(Tournament).filter_by(tournament_id=tournament_id).first()
+        if not tournament:
+            return False, f"Tournament {tournament_id} not found"
+
+        if fencer is None:
+            fencer = session.query(Fencer).filter_by(fencer_id=fencer_id).first()
+        if not fencer:
+            return False, f"Fencer {fencer_id} not found"
+
+        # Check if already registered
+        existing_result = session.query(TournamentResult).filter_by(
+            tournament_id=tournament_id,
+            fencer_id=fencer_id
+        ).first()
+
     if existing_result:
         return False, f"Fencer {fencer_id} is already registered for this tournament"
     
@@ -122,17 +157,25 @@ def register_fencer_for_tournament(fencer_id: int, tournament_id: int,
         points_awarded=0
     )
     session.add(result)
-    session.commit()
-    
+    if commit:
+        session.commit()
+    else:
+        session.flush()
+
     logger.info(f"Registered fencer {fencer_id} for tournament {tournament_id}")
     return True, f"Fencer {fencer_id} successfully registered"
 
 
-def _register_fencer_impl(fencer_id: int, tournament_id: int, session) -> Tuple[bool, str]:
+def _register_fencer_impl(fencer_id: int, tournament_id: int, session,
+                          commit: bool = True,
+                          tournament: Tournament = None,
+                          fencer: Fencer = None) -> Tuple[bool, str]:
     """Internal implementation of fencer registration (kept for backward compatibility)."""
     # This function is now integrated into register_fencer_for_tournament
     # Kept as a stub for backward compatibility
-    return register_fencer_for_tournament(fencer_id, tournament_id, session=session)
+    return register_fencer_for_tournament(fencer_id, tournament_id,
+                                          commit=commit, tournament=tournament,
+                                          fencer=fencer, session=session)
 
 
 @with_session
@@ -179,31 +222,57 @@ def record_tournament_results(tournament_id: int, results_dict: Dict[int, int],
             msg += f"Extra fencers not registered: {extra}."
         return False, msg
     
-    # Validate placements are unique
-    placements = list(results_dict.values())
-    if len(placements) != len(set(placements)):
+    # Validate placements are unique - single numpy pass instead of
+    # materializing a list plus a set from the dict values
+    placements = np.fromiter(results_dict.values(), dtype=np.int32,
+                             count=len(results_dict))
+    if np.unique(placements).size != placements.size:
         return False, "Duplicate placements found. Each fencer must have a unique placement."
     
-    # Update results and calculate points
-    for fencer_id, placement in results_dict.items():
-        # Find the result record
-        result = next((r for r in registered_results if r.fencer_id == fencer_id), None)
-        if not result:
-            continue
-        
-        # Calculate points based on placement and competition type
-        points = calculate_points(placement, tournament.competition_type)
-        
-        # Update result
-        result.placement = placement
-        result.points_awarded = points
-        
-        # Update fencer's ranking
-        fencer = session.query(Fencer).filter_by(fencer_id=fencer_id).first()
-        if fencer and fencer.rankings:
-            ranking = fencer.rankings[0]  # Each fencer has one ranking
-            ranking.update_ranking(points)
-    
+    # Calculate points for every placement up front, then push both the
+    # result updates and the ranking deltas as two executemany UPDATEs.
+    # The old loop issued a Fencer query plus a dirty-object flush per
+    # fencer (2N round-trips); this is 2 statements regardless of N.
+    # The points table is built once per tournament and indexed by the
+    # whole placement array, instead of calling calculate_points (and
+    # re-branching on competition_type) per fencer.
+    # Placements below 1 (e.g. the 0 placeholder written at registration)
+    # fall outside the table, so they're masked to 0 points - the same
+    # answer calculate_points gives for them. An empty results_dict (a
+    # tournament with no registrations) skips the table entirely.
+    if placements.size:
+        points_table = compute_points_table(
+            tournament.competition_type,
+            max_placement=max(int(placements.max()), 1))
+        points = np.where(placements >= 1,
+                          points_table[np.clip(placements, 1, None) - 1], 0)
+        deltas = list(zip(results_dict.keys(), placements.tolist(), points.tolist()))
+    else:
+        deltas = []
+
+    # Core-table statements so the executemany path is used directly,
+    # without the ORM's per-object bulk-update-by-primary-key machinery
+    if deltas:
+        session.execute(
+            update(TournamentResult.__table__)
+            .where(TournamentResult.__table__.c.tournament_id == bindparam("tid"),
+                   TournamentResult.__table__.c.fencer_id == bindparam("fid"))
+            .values(placement=bindparam("pl"), points_awarded=bindparam("pts")),
+            [{"tid": tournament_id, "fid": fid, "pl": pl, "pts": pts}
+             for fid, pl, pts in deltas],
+        )
+
+        session.execute(
+            update(Ranking.__table__)
+            .where(Ranking.__table__.c.fencer_id == bindparam("fid"))
+            .values(points=Ranking.__table__.c.points + bindparam("delta")),
+            [{"fid": fid, "delta": pts} for fid, _, pts in deltas],
+        )
+
+        # The bulk UPDATEs bypass the identity map, so drop any stale copies
+        # of the rows we just touched before anyone reads them back
+        session.expire_all()
+
     # Mark tournament as completed
     tournament.status = "Completed"
     
@@ -242,28 +311,42 @@ def import_tournament_results_from_csv(csv_file: str, tournament_id: int = None,
         Tuple (success: bool, message: str, tournament_id: int)
     """
     try:
-        # Read CSV file
-        df = pd.read_csv(csv_file)
-        
+        # Read CSV file, keeping only the result columns and the optional
+        # tournament metadata columns; pinned dtypes skip type inference.
+        # usecols is resolved against the header because the pyarrow
+        # engine doesn't take callables.
+        result_columns = {'fencer_id', 'placement', 'tournament_name', 'date',
+                          'weapon', 'bracket', 'competition_type'}
+        header = pd.read_csv(csv_file, nrows=0).columns
+        read_kwargs = dict(
+            usecols=[c for c in header if c in result_columns],
+            dtype={'fencer_id': 'int64', 'placement': 'int64'},
+        )
+        try:
+            # PyArrow parses the CSV with multiple threads; the default
+            # C engine is single-threaded
+            df = pd.read_csv(csv_file, engine='pyarrow', **read_kwargs)
+        except (ImportError, ValueError):
+            df = pd.read_csv(csv_file, **read_kwargs)
+
         # Validate required columns
         if 'fencer_id' not in df.columns or 'placement' not in df.columns:
             return False, "CSV must contain 'fencer_id' and 'placement' columns", 0
         
         # If tournament_id not provided, check if CSV has tournament metadata
         if tournament_id is None:
-            # Try to get tournament info from CSV columns or create default
-            tournament_name = df.get('tournament_name', ['Imported Tournament']).iloc[0] if 'tournament_name' in df.columns else "Imported Tournament"
-            date_str = df.get('date', [pd.Timestamp.today()]).iloc[0] if 'date' in df.columns else pd.Timestamp.today()
-            weapon = df.get('weapon', ['Foil']).iloc[0] if 'weapon' in df.columns else "Foil"
-            bracket = df.get('bracket', ['Senior']).iloc[0] if 'bracket' in df.columns else "Senior"
-            competition_type = df.get('competition_type', ['Regional']).iloc[0] if 'competition_type' in df.columns else "Regional"
-            
+            # Try to get tournament info from CSV columns or create default.
+            # One membership test per column instead of the old double-check
+            # that also built a throwaway Series on the default branch.
+            def first_or(col, default):
+                return df[col].iloc[0] if col in df.columns else default
+
             tournament = create_tournament(
-                tournament_name=tournament_name,
-                date=date_str,
-                weapon=weapon,
-                bracket=bracket,
-                competition_type=competition_type,
+                tournament_name=first_or('tournament_name', "Imported Tournament"),
+                date=first_or('date', pd.Timestamp.today()),
+                weapon=first_or('weapon', "Foil"),
+                bracket=first_or('bracket', "Senior"),
+                competition_type=first_or('competition_type', "Regional"),
                 status="Completed",  # Assume completed if importing results
                 session=session
             )
@@ -274,26 +357,63 @@ def import_tournament_results_from_csv(csv_file: str, tournament_id: int = None,
             if not tournament:
                 return False, f"Tournament {tournament_id} not found", 0
         
-        # Build results dictionary
-        results_dict = {}
-        for _, row in df.iterrows():
-            fencer_id = int(row['fencer_id'])
-            placement = int(row['placement'])
-            results_dict[fencer_id] = placement
+        # Build results dictionary from the two columns directly - no
+        # per-row Series boxing via iterrows()
+        results_dict = dict(zip(df['fencer_id'].astype(int).tolist(),
+                                df['placement'].astype(int).tolist()))
         
-        # First, register all fencers (if not already registered)
-        for fencer_id in results_dict.keys():
-            existing_result = session.query(TournamentResult).filter_by(
-                tournament_id=tournament_id,
-                fencer_id=fencer_id
-            ).first()
-            
-            if not existing_result:
-                # Register fencer (will validate eligibility)
-                success, msg = register_fencer_for_tournament(fencer_id, tournament_id, session=session)
-                if not success:
-                    # If registration fails, log warning but continue
-                    logger.warning(f"Could not register fencer {fencer_id}: {msg}")
+        # First, register all fencers (if not already registered).
+        # Bulk version of the old per-fencer loop: one query for existing
+        # registrations, chunked IN queries for the fencers, eligibility
+        # checks in Python, then one executemany INSERT - instead of
+        # roughly four queries plus a commit per fencer.
+        existing_fids = {fid for (fid,) in session.query(TournamentResult.fencer_id)
+                         .filter_by(tournament_id=tournament_id)}
+        to_register = [fid for fid in results_dict if fid not in existing_fids]
+
+        # selectinload pulls every fencer's rankings in one batched IN query;
+        # is_eligible_fencer reads fencer.rankings, which would otherwise
+        # lazy-load once per fencer
+        fencers_by_id = {}
+        for i in range(0, len(to_register), 1000):
+            chunk = to_register[i:i + 1000]
+            fencers_by_id.update(
+                (f.fencer_id, f)
+                for f in session.query(Fencer)
+                .options(selectinload(Fencer.rankings))
+                .filter(Fencer.fencer_id.in_(chunk))
+            )
+
+        # is_eligible_fencer's capacity check counts tournament.results,
+        # which doesn't see the rows accumulating in registration_rows -
+        # so track the running total here and stop accepting once full
+        # (the old per-row commit re-counted the collection each pass)
+        registration_rows = []
+        seats_taken = len(tournament.results)
+        for fencer_id in to_register:
+            fencer = fencers_by_id.get(fencer_id)
+            if fencer is None:
+                logger.warning(f"Could not register fencer {fencer_id}: Fencer {fencer_id} not found")
+                continue
+            if (tournament.max_participants is not None
+                    and seats_taken >= tournament.max_participants):
+                logger.warning(f"Could not register fencer {fencer_id}: Tournament is full")
+                continue
+            is_eligible, reason = tournament.is_eligible_fencer(fencer)
+            if not is_eligible:
+                # If registration fails, log warning but continue
+                logger.warning(f"Could not register fencer {fencer_id}: {reason}")
+                continue
+            seats_taken += 1
+            registration_rows.append({
+                'tournament_id': tournament_id,
+                'fencer_id': fencer_id,
+                'placement': 0,  # Will be updated when results are recorded
+                'points_awarded': 0,
+            })
+
+        if registration_rows:
+            session.execute(insert(TournamentResult.__table__), registration_rows)
         
         # Set tournament status to "In Progress" so we can record results
         tournament.status = "In Progress"
@@ -328,9 +448,18 @@ def get_tournament_participants(tournament_id: int, session=None) -> List[Fencer
     Returns:
         List of Fencer objects
     """
-    results = session.query(TournamentResult).filter_by(tournament_id=tournament_id).all()
-    fencer_ids = [r.fencer_id for r in results]
-    fencers = session.query(Fencer).filter(Fencer.fencer_id.in_(fencer_ids)).all()
+    # Single JOIN instead of fetching the result rows and then the fencers
+    # in a second round-trip. yield_per streams the raw rows from the
+    # driver in 1000-row batches, so large tournaments don't buffer the
+    # whole cursor result alongside the ORM objects. The return stays a
+    # list (not a generator) because callers len() it and @with_session
+    # may close the session as soon as this function returns.
+    fencers = list(
+        session.query(Fencer)
+        .join(TournamentResult, TournamentResult.fencer_id == Fencer.fencer_id)
+        .filter(TournamentResult.tournament_id == tournament_id)
+        .yield_per(1000)
+    )
     return fencers
 
 
@@ -346,7 +475,13 @@ def get_tournament_results(tournament_id: int, session=None) -> List[TournamentR
     Returns:
         List of TournamentResult objects sorted by placement (1st, 2nd, 3rd, etc.)
     """
-    results = session.query(TournamentResult).filter_by(
-        tournament_id=tournament_id
-    ).order_by(TournamentResult.placement.asc()).all()
+    # Stream in 1000-row batches rather than buffering the full cursor
+    # result up front (see get_tournament_participants for why the return
+    # is still a list)
+    results = list(
+        session.query(TournamentResult)
+        .filter_by(tournament_id=tournament_id)
+        .order_by(TournamentResult.placement.asc())
+        .yield_per(1000)
+    )
     return results
@@ -8,6 +8,8 @@ The system uses a weighted point structure where more prestigious competitions
 (Championships, International) award more points than typical Open competitions.
 """
 
+import numpy as np
+
 # Base points awarded by placement (before weighting)
 # These are the points for a "Regional" level competition
 BASE_POINTS_BY_PLACEMENT = {
@@ -144,6 +146,37 @@ def calculate_points(placement: int, competition_type: str) -> int:
     return final_points
 
 
+def compute_points_table(competition_type: str, max_placement: int) -> "np.ndarray":
+    """
+    Precompute the points for every placement from 1 to max_placement.
+
+    Recording a whole tournament calls calculate_points once per fencer,
+    re-branching on competition_type each time. This builds the complete
+    points-by-placement vector up front so callers can index it directly
+    (points_table[placement - 1]) or apply it to an entire placement
+    array in one vectorized lookup.
+
+    Args:
+        competition_type: Type of competition affecting point weighting
+                         ("Local", "Regional", "National", "Championship", "International")
+        max_placement: Highest placement the table needs to cover
+
+    Returns:
+        numpy int32 array of length max_placement where index i holds the
+        points awarded for placement i + 1
+
+    Example:
+        table = compute_points_table("Championship", max_placement=8)
+        table[0]   # 200 (1st place in Championship)
+        table[4]   # 40 (5th place in Championship)
+    """
+    multiplier = get_competition_multiplier(competition_type)
+    return np.array(
+        [int(round(get_base_points(p) * multiplier)) for p in range(1, max_placement + 1)],
+        dtype=np.int32,
+    )
+
+
 def get_point_structure(competition_type: str = "Regional") -> dict:
     """
     Get the complete point structure for a given competition type.
@@ -15,198 +15,254 @@ from src.database import init_db, get_session_context, reset_db
 from src.models import Fencer, Club, Ranking
 from src.enums import AgeBracket
 from src.ingestion import ingest_fencers_from_csv
-import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload, joinedload
+from datetime import date
+
+# Each test function appends its report lines to a list and writes them to
+# stdout in one go when it finishes. With line-buffered stdout every print
+# is a separate lock-acquire-and-flush, interleaved with the DB work; one
+# buffered write keeps the I/O out of the timed path. The flush lives in a
+# finally block so a mid-test failure still shows how far the test got.
+
+
+def _flush(lines):
+    """Write the buffered report lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def test_basic_operations():
     """
     Test basic database operations: create, read, update, delete.
     """
-    print("\n" + "="*50)
-    print("Testing Basic Database Operations")
-    print("="*50)
-    
-    # Initialize database (creates tables)
-    init_db()
-    
-    # Use session context manager for automatic cleanup
-    with get_session_context() as session:
-        # Test 1: Create a club
-        print("\n1. Creating a club...")
-        club = Club(
-            club_id="Test_Club_1",
-            club_name="Test Fencing Club",
-            start_year=2020,
-            status="Active",
-            weapon_club="Sabre"
-        )
-        session.add(club)
-        session.commit()
-        print(f"   Created: {club}")
-        
-        # Test 2: Create a fencer
-        print("\n2. Creating a fencer...")
-        fencer = Fencer(
-            fencer_id=99999,
-            first_name="Test",
-            last_name="Fencer",
-            dob=pd.to_datetime('2003-03-02'),
-            gender='M',
-            weapon='Sabre',
-            club_id="Test_Club_1"
-        )
-        session.add(fencer)
-        session.commit()
-        print(f"   Created: {fencer}")
-        
-        # Test 3: Check that rankings were automatically created
-        print("\n3. Checking automatic ranking creation...")
-        # Each fencer should have exactly ONE ranking for their age bracket
-        print(f"   Fencer has {len(fencer.rankings)} ranking(s):")
-        if len(fencer.rankings) == 1:
-            ranking = fencer.rankings[0]
-            print(f"      - {ranking} (Correct: exactly one bracket)")
-        else:
-            print(f"      Warning: Expected 1 ranking, found {len(fencer.rankings)}")
-            for ranking in fencer.rankings:
-                print(f"      - {ranking}")
-        
-        # Test 4: Update ranking points
-        print("\n4. Updating ranking points...")
-        senior_ranking = fencer.get_ranking_for_bracket("Senior")
-        if senior_ranking:
-            senior_ranking.update_ranking(100)
+    out = []
+    out.append("\n" + "="*50)
+    out.append("Testing Basic Database Operations")
+    out.append("="*50)
+
+    try:
+        # Initialize database (creates tables)
+        init_db()
+
+        # Use session context manager for automatic cleanup
+        with get_session_context() as session:
+            # Test 1: Create a club
+            out.append("\n1. Creating a club...")
+            club = Club(
+                club_id="Test_Club_1",
+                club_name="Test Fencing Club",
+                start_year=2020,
+                status="Active",
+                weapon_club="Sabre"
+            )
+            session.add(club)
+            # Flush (not commit) so the club row exists for the fencer's FK;
+            # both creates then share a single COMMIT below
+            session.flush()
+            out.append(f"   Created: {club}")
+
+            # Test 2: Create a fencer
+            out.append("\n2. Creating a fencer...")
+            fencer = Fencer(
+                fencer_id=99999,
+                first_name="Test",
+                last_name="Fencer",
+                # A plain date literal - pd.to_datetime here paid for pandas'
+                # full format-sniffing parser to build one constant
+                dob=date(2003, 3, 2),
+                gender='M',
+                weapon='Sabre',
+                club_id="Test_Club_1"
+            )
+            session.add(fencer)
             session.commit()
-            print(f"   Updated Senior ranking: {senior_ranking}")
-        
-        # Test 5: Query fencer back from database
-        print("\n5. Querying fencer from database...")
-        queried_fencer = session.query(Fencer).filter_by(fencer_id=99999).first()
-        if queried_fencer:
-            print(f"   Found: {queried_fencer}")
-            print(f"   Club: {queried_fencer.club}")
-            print(f"   Total points: {queried_fencer.get_total_points()}")
-        
-        # Test 6: Query club and check fencers
-        print("\n6. Querying club and checking fencers...")
-        queried_club = session.query(Club).filter_by(club_id="Test_Club_1").first()
-        if queried_club:
-            print(f"   Club: {queried_club.club_name}")
-            print(f"   Number of fencers: {queried_club.get_fencer_count()}")
-            print(f"   Total club points: {queried_club.get_club_total_points()}")
-        
-        # Test 7: Delete test data
-        print("\n7. Cleaning up test data...")
-        session.delete(fencer)
-        session.delete(club)
-        session.commit()
-        print("   Test data deleted")
+            out.append(f"   Created: {fencer}")
+
+            # Test 3: Check that rankings were automatically created
+            out.append("\n3. Checking automatic ranking creation...")
+            # Each fencer should have exactly ONE ranking for their age bracket
+            out.append(f"   Fencer has {len(fencer.rankings)} ranking(s):")
+            if len(fencer.rankings) == 1:
+                ranking = fencer.rankings[0]
+                out.append(f"      - {ranking} (Correct: exactly one bracket)")
+            else:
+                out.append(f"      Warning: Expected 1 ranking, found {len(fencer.rankings)}")
+                for ranking in fencer.rankings:
+                    out.append(f"      - {ranking}")
+
+            # Test 4: Update ranking points
+            out.append("\n4. Updating ranking points...")
+            senior_ranking = fencer.get_ranking_for_bracket("Senior")
+            if senior_ranking:
+                senior_ranking.update_ranking(100)
+                session.commit()
+                out.append(f"   Updated Senior ranking: {senior_ranking}")
+
+            # Test 5: Query fencer back from database
+            # session.get checks the identity map first - the fencer was just
+            # inserted in this session, so this returns it without any SQL.
+            # The eager-load options cover the club/rankings accesses below
+            # on a cache miss.
+            out.append("\n5. Querying fencer from database...")
+            queried_fencer = session.get(
+                Fencer, 99999,
+                options=[joinedload(Fencer.club), selectinload(Fencer.rankings)],
+            )
+            if queried_fencer:
+                out.append(f"   Found: {queried_fencer}")
+                out.append(f"   Club: {queried_fencer.club}")
+                out.append(f"   Total points: {queried_fencer.get_total_points()}")
+
+            # Test 6: Query club and check fencers
+            out.append("\n6. Querying club and checking fencers...")
+            queried_club = session.get(Club, "Test_Club_1")
+            if queried_club:
+                out.append(f"   Club: {queried_club.club_name}")
+                out.append(f"   Number of fencers: {queried_club.get_fencer_count()}")
+                out.append(f"   Total club points: {queried_club.get_club_total_points()}")
+
+            # Test 7: Delete test data
+            out.append("\n7. Cleaning up test data...")
+            session.delete(fencer)
+            session.delete(club)
+            session.commit()
+            out.append("   Test data deleted")
+    finally:
+        _flush(out)
 
 
 def test_csv_ingestion():
     """
     Test ingesting data from the existing CSV file.
     """
-    print("\n" + "="*50)
-    print("Testing CSV Ingestion")
-    print("="*50)
-    
-    # Initialize database
-    init_db()
-    
-    # Check if data already exists
-    with get_session_context() as session:
-        from src.models import Fencer
-        existing_count = session.query(Fencer).count()
-        if existing_count > 0:
-            print(f"\nDatabase already contains {existing_count} fencers.")
-            print("Skipping ingestion to avoid duplicates.")
-            print("If you want to re-import, reset the database first using: reset_db()")
-            
-            # Use existing data for testing
-            fencers_dict = {f.fencer_id: f for f in session.query(Fencer).all()}
-        else:
-            # Ingest fencers from CSV
-            print("\nIngesting fencers from CSV...")
-            csv_path = os.path.join(os.path.dirname(__file__), "..", "data", "csv", "synth_data.csv")
-            fencers_dict = ingest_fencers_from_csv(csv_path)
-    
-    print(f"\nSuccessfully ingested {len(fencers_dict)} fencers")
-    
-    # Verify data in database
-    with get_session_context() as session:
-        # Count fencers in database
-        fencer_count = session.query(Fencer).count()
-        print(f"Total fencers in database: {fencer_count}")
-        
-        # Count rankings
-        ranking_count = session.query(Ranking).count()
-        print(f"Total rankings in database: {ranking_count}")
-        
-        # Count clubs
-        club_count = session.query(Club).count()
-        print(f"Total clubs in database: {club_count}")
-        
-        # Query a specific fencer
-        print("\nQuerying a specific fencer (ID: 70196)...")
-        fencer = session.query(Fencer).filter_by(fencer_id=70196).first()
-        if fencer:
-            print(f"   Name: {fencer.full_name}")
-            print(f"   DOB: {fencer.dob}")
-            print(f"   Gender: {fencer.gender}")
-            print(f"   Weapon: {fencer.weapon}")
-            print(f"   Club: {fencer.club_id}")
-            print(f"   Rankings:")
-            for ranking in fencer.rankings:
-                print(f"      - {ranking}")
-        
-        # Query fencers by bracket to show distribution
-        print("\nFencer distribution by bracket:")
-        bracket_names = ["U11", "U13", "U15", "Cadet", "Junior", "Senior"]
-        for bracket_name in bracket_names:
-            count = session.query(Ranking).filter_by(bracket_name=bracket_name).count()
-            print(f"   {bracket_name:8s}: {count:4d} fencers")
-        
-        # Query top fencers by points in Senior bracket
-        print("\nTop 5 fencers in Senior bracket:")
-        senior_rankings = session.query(Ranking).filter_by(
-            bracket_name="Senior"
-        ).order_by(Ranking.points.desc()).limit(5).all()
-        
-        if senior_rankings:
-            for ranking in senior_rankings:
-                fencer = ranking.fencer
-                print(f"   {fencer.full_name}: {ranking.points} pts ({fencer.weapon})")
-        else:
-            print("   No fencers in Senior bracket yet")
+    out = []
+    out.append("\n" + "="*50)
+    out.append("Testing CSV Ingestion")
+    out.append("="*50)
+
+    try:
+        # Initialize database
+        init_db()
+
+        # One session covers both the ingestion check and the verification
+        # below - everything after ingestion is read-only, so there's no need
+        # to tear the session down and reconnect between the two halves
+        with get_session_context() as session:
+            # Bare SELECT COUNT(*) - Query.count() wraps the query in a
+            # subquery that SQLite's planner doesn't optimize as well
+            existing_count = session.scalar(select(func.count()).select_from(Fencer))
+            if existing_count > 0:
+                out.append(f"\nDatabase already contains {existing_count} fencers.")
+                out.append("Skipping ingestion to avoid duplicates.")
+                out.append("If you want to re-import, reset the database first using: reset_db()")
+
+                # Use existing data for testing. Only the count is consumed
+                # below, so don't materialize every Fencer ORM object
+                # (identity map plus attribute dicts, ~1 KB per row) just to
+                # measure the dict's size.
+                ingested_count = existing_count
+            else:
+                # Ingest fencers from CSV
+                out.append("\nIngesting fencers from CSV...")
+                csv_path = os.path.join(os.path.dirname(__file__), "..", "data", "csv", "synth_data.csv")
+                ingested_count = len(ingest_fencers_from_csv(csv_path, session=session))
+
+            out.append(f"\nSuccessfully ingested {ingested_count} fencers")
+
+            # Verify data in database: all three table counts in a single
+            # round-trip via scalar subqueries
+            fencer_count, ranking_count, club_count = session.execute(
+                select(
+                    select(func.count()).select_from(Fencer).scalar_subquery(),
+                    select(func.count()).select_from(Ranking).scalar_subquery(),
+                    select(func.count()).select_from(Club).scalar_subquery(),
+                )
+            ).one()
+            out.append(f"Total fencers in database: {fencer_count}")
+            out.append(f"Total rankings in database: {ranking_count}")
+            out.append(f"Total clubs in database: {club_count}")
+
+            # Query a specific fencer
+            out.append("\nQuerying a specific fencer (ID: 70196)...")
+            fencer = session.query(Fencer).options(
+                selectinload(Fencer.rankings)
+            ).filter_by(fencer_id=70196).first()
+            if fencer:
+                out.append(f"   Name: {fencer.full_name}")
+                out.append(f"   DOB: {fencer.dob}")
+                out.append(f"   Gender: {fencer.gender}")
+                out.append(f"   Weapon: {fencer.weapon}")
+                out.append(f"   Club: {fencer.club_id}")
+                out.append(f"   Rankings:")
+                for ranking in fencer.rankings:
+                    out.append(f"      - {ranking}")
+
+            # Query fencers by bracket to show distribution - one GROUP BY
+            # round-trip instead of a COUNT query per bracket
+            out.append("\nFencer distribution by bracket:")
+            bracket_names = ["U11", "U13", "U15", "Cadet", "Junior", "Senior"]
+            counts = dict(
+                session.query(Ranking.bracket_name, func.count())
+                .group_by(Ranking.bracket_name).all()
+            )
+            for bracket_name in bracket_names:
+                out.append(f"   {bracket_name:8s}: {counts.get(bracket_name, 0):4d} fencers")
+
+            # Query top fencers by points in Senior bracket - one JOIN instead
+            # of resolving ranking.fencer lazily for each of the five rows
+            out.append("\nTop 5 fencers in Senior bracket:")
+            top_seniors = session.execute(
+                select(Ranking, Fencer)
+                .join(Fencer, Ranking.fencer_id == Fencer.fencer_id)
+                .where(Ranking.bracket_name == "Senior")
+                .order_by(Ranking.points.desc())
+                .limit(5)
+            ).all()
+
+            if top_seniors:
+                for ranking, fencer in top_seniors:
+                    out.append(f"   {fencer.full_name}: {ranking.points} pts ({fencer.weapon})")
+            else:
+                out.append("   No fencers in Senior bracket yet")
+    finally:
+        _flush(out)
 
 
 def test_relationships():
     """
     Test that relationships between models work correctly.
     """
-    print("\n" + "="*50)
-    print("Testing Model Relationships")
-    print("="*50)
-    
-    with get_session_context() as session:
-        # Get a club
-        club = session.query(Club).first()
-        if club:
-            print(f"\nClub: {club.club_name}")
-            print(f"   Number of fencers: {len(club.fencers)}")
-            
-            # Show first 3 fencers in the club
-            print(f"\n   First 3 fencers:")
-            for fencer in club.fencers[:3]:
-                print(f"      - {fencer.full_name} ({fencer.weapon})")
-        
-        # Get a fencer and show their club
-        fencer = session.query(Fencer).first()
-        if fencer:
-            print(f"\nFencer: {fencer.full_name}")
-            if fencer.club:
-                print(f"   Club: {fencer.club.club_name}")
-            print(f"   Rankings: {len(fencer.rankings)} brackets")
+    out = []
+    out.append("\n" + "="*50)
+    out.append("Testing Model Relationships")
+    out.append("="*50)
+
+    try:
+        with get_session_context() as session:
+            # Get a club (pull its fencers in the same round-trip instead of
+            # lazy-loading the collection when it's first touched)
+            club = session.query(Club).options(selectinload(Club.fencers)).first()
+            if club:
+                out.append(f"\nClub: {club.club_name}")
+                out.append(f"   Number of fencers: {len(club.fencers)}")
+
+                # Show first 3 fencers in the club
+                out.append(f"\n   First 3 fencers:")
+                for fencer in club.fencers[:3]:
+                    out.append(f"      - {fencer.full_name} ({fencer.weapon})")
+
+            # Get a fencer and show their club (club and rankings eager-loaded
+            # for the same reason)
+            fencer = session.query(Fencer).options(
+                joinedload(Fencer.club), selectinload(Fencer.rankings)
+            ).first()
+            if fencer:
+                out.append(f"\nFencer: {fencer.full_name}")
+                if fencer.club:
+                    out.append(f"   Club: {fencer.club.club_name}")
+                out.append(f"   Rankings: {len(fencer.rankings)} brackets")
+    finally:
+        _flush(out)
 
 
 if __name__ == "__main__":
@@ -216,11 +272,11 @@ if __name__ == "__main__":
     print("="*50)
     print("SQLAlchemy Models Test Suite")
     print("="*50)
-    
+
     # Option to reset database (uncomment to start fresh)
     # WARNING: This will delete all data!
     # reset_db()
-    
+
     # Run tests
     try:
         test_basic_operations()
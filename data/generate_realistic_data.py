@@ -8,13 +8,24 @@ Generate realistic fencing dataset with:
 
 import pandas as pd
 import numpy as np
-from faker import Faker
 from datetime import date, timedelta
 import random
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Shared generation helpers live in synth.py (importing it is side-effect
+# free - its driver is __main__-guarded)
+from synth import (
+    fake_dob_for_bracket, write_csv,
+    FIRST_NAMES_MALE, FIRST_NAMES_FEMALE, LAST_NAMES,
+)
 
-# Initialize Faker
-fake = Faker()
 
 # Realistic club name components
 CLUB_PREFIXES = [
@@ -37,14 +48,22 @@ CLUB_TYPES = [
 ]
 
 
-def generate_club_name():
-    """Generate a realistic club name"""
-    style = random.choice([
-        lambda: f"{random.choice(CLUB_LOCATIONS)} {random.choice(CLUB_TYPES)}",
-        lambda: f"{random.choice(CLUB_PREFIXES)} {random.choice(CLUB_TYPES)}",
-        lambda: f"{random.choice(CLUB_LOCATIONS)} {random.choice(CLUB_PREFIXES)} {random.choice(['Fencing Club', 'Fencing Academy'])}",
-    ])
-    return style()
+def generate_club_names(n):
+    """
+    Generate n unique, realistic club names.
+
+    Enumerates the full prefix/location x type combination space up front
+    and shuffles it, so uniqueness is guaranteed in O(n) with no
+    rejection-sampling retries.
+    """
+    all_names = (
+        [f"{loc} {typ}" for loc in CLUB_LOCATIONS for typ in CLUB_TYPES]
+        + [f"{pre} {typ}" for pre in CLUB_PREFIXES for typ in CLUB_TYPES]
+    )
+    if n > len(all_names):
+        raise ValueError(f"Cannot generate {n} unique club names (max {len(all_names)})")
+    random.shuffle(all_names)
+    return all_names[:n]
 
 
 def create_clubs(num_clubs=15):
@@ -54,110 +73,113 @@ def create_clubs(num_clubs=15):
     """
     clubs = []
     weapons = ["Sabre", "Foil", "Epee"]
-    used_names = set()
-    
-    for i in range(num_clubs):
+    names = generate_club_names(num_clubs)
+
+    # Draw all locations in one batch call instead of one random.choice per club
+    locations = random.choices(CLUB_LOCATIONS, k=num_clubs)
+
+    for i, name in enumerate(names):
         # Ensure equal distribution of weapons
         weapon = weapons[i % len(weapons)]
-        
-        # Generate unique club name
-        name = generate_club_name()
-        while name in used_names:
-            name = generate_club_name()
-        used_names.add(name)
-        
+
         clubs.append({
             'club_id': i + 1,
             'club_name': name,
             'primary_weapon': weapon,
-            'location': random.choice(CLUB_LOCATIONS),
+            'location': locations[i],
             'founded_year': random.randint(1950, 2020)
         })
     
     return pd.DataFrame(clubs)
 
 
-def fake_dob_for_bracket(bracket: str):
-    """Generate DOB for specific age bracket"""
-    today = date.today()
-    
-    # Age ranges for each bracket
-    bracket_ages = {
-        "U11": (7, 10),
-        "U13": (11, 12),
-        "U15": (13, 14),
-        "Cadet": (15, 16),
-        "Junior": (17, 19),
-        "Senior": (20, 65)
-    }
-    
-    min_age, max_age = bracket_ages.get(bracket, (20, 65))
-    start_date = today - timedelta(days=max_age * 365 + 364)
-    end_date = today - timedelta(days=min_age * 365)
-    
-    random_days = random.randint(0, (end_date - start_date).days)
-    return start_date + timedelta(days=random_days)
+def _generate_club_fencers(club_id, weapon, fencers_per_club, start_id):
+    """
+    Generate the fencer rows for a single club.
+
+    Top-level function (not a closure) so create_fencers can dispatch it
+    to worker processes. IDs are assigned from a pre-allocated range
+    starting at start_id, so clubs never collide across workers.
+    """
+    brackets = ["U11", "U13", "U15", "Cadet", "Junior", "Senior"]
+    genders = ["M", "F"]
+
+    fencers = []
+    fencer_id = start_id
 
+    # For each club, create equal distribution across brackets and genders
+    # 6 brackets × 2 genders = 12 combinations
+    fencers_per_combo = fencers_per_club // 12
+    remainder = fencers_per_club % 12
 
-def create_fencers(clubs_df, fencers_per_club=40):
+    combo_index = 0
+    for bracket in brackets:
+        for gender in genders:
+            # Add extra fencer for first 'remainder' combinations
+            count = fencers_per_combo + (1 if combo_index < remainder else 0)
+            combo_index += 1
+
+            # Draw all name parts for this combo group in batch calls
+            # instead of one fake.name_male()/name_female() per fencer
+            first_pool = FIRST_NAMES_MALE if gender == "M" else FIRST_NAMES_FEMALE
+            firsts = random.choices(first_pool, k=count)
+            lasts = random.choices(LAST_NAMES, k=count)
+
+            for first_name, last_name in zip(firsts, lasts):
+                full_name = f"{first_name} {last_name}"
+
+                # Generate DOB for bracket
+                dob = fake_dob_for_bracket(bracket)
+
+                fencers.append({
+                    'fencer_id': fencer_id,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'full_name': full_name,
+                    'dob': dob,
+                    'gender': gender,
+                    'weapon': weapon,
+                    'club_id': club_id,
+                    # Cheap formatted contact fields - nothing downstream
+                    # consumes these, so no need for a faker call per row
+                    'email': f"{first_name.lower()}.{last_name.lower()}{fencer_id}@example.com",
+                    'phone': f"555-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
+                })
+
+                fencer_id += 1
+
+    return fencers
+
+
+def create_fencers(clubs_df, fencers_per_club=40, parallel=True):
     """
     Create fencers distributed across clubs
     Each club gets ~40 fencers, specialized in their primary weapon
     Fencers are distributed across all age brackets and both genders
+
+    Clubs are independent, so generation fans out over a process pool
+    when parallel=True (name/DOB generation is CPU-bound).
     """
-    brackets = ["U11", "U13", "U15", "Cadet", "Junior", "Senior"]
-    genders = ["M", "F"]
-    
-    fencers = []
-    used_ids = set()
-    fencer_id = 1
-    
-    for _, club in clubs_df.iterrows():
-        weapon = club['primary_weapon']
-        club_id = club['club_id']
-        
-        # For each club, create equal distribution across brackets and genders
-        # 6 brackets × 2 genders = 12 combinations
-        fencers_per_combo = fencers_per_club // 12
-        remainder = fencers_per_club % 12
-        
-        combo_index = 0
-        for bracket in brackets:
-            for gender in genders:
-                # Add extra fencer for first 'remainder' combinations
-                count = fencers_per_combo + (1 if combo_index < remainder else 0)
-                combo_index += 1
-                
-                for _ in range(count):
-                    # Generate name based on gender
-                    if gender == "M":
-                        full_name = fake.name_male()
-                    else:
-                        full_name = fake.name_female()
-                    
-                    name_parts = full_name.split()
-                    first_name = name_parts[0]
-                    last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else name_parts[0]
-                    
-                    # Generate DOB for bracket
-                    dob = fake_dob_for_bracket(bracket)
-                    
-                    fencers.append({
-                        'fencer_id': fencer_id,
-                        'first_name': first_name,
-                        'last_name': last_name,
-                        'full_name': full_name,
-                        'dob': dob,
-                        'gender': gender,
-                        'weapon': weapon,
-                        'club_id': club_id,
-                        'email': fake.email(),
-                        'phone': fake.phone_number()
-                    })
-                    
-                    fencer_id += 1
-    
-    return pd.DataFrame(fencers)
+    # Pull the two columns we need as plain arrays instead of iterrows(),
+    # which boxes every row into a Series
+    club_ids = clubs_df['club_id'].to_numpy()
+    weapons = clubs_df['primary_weapon'].to_numpy()
+    # Pre-allocate a disjoint fencer_id range per club
+    start_ids = [1 + i * fencers_per_club for i in range(len(club_ids))]
+
+    if parallel and len(club_ids) > 1:
+        with ProcessPoolExecutor() as executor:
+            chunks = list(executor.map(
+                _generate_club_fencers,
+                club_ids, weapons, repeat(fencers_per_club), start_ids
+            ))
+    else:
+        chunks = [
+            _generate_club_fencers(cid, w, fencers_per_club, sid)
+            for cid, w, sid in zip(club_ids, weapons, start_ids)
+        ]
+
+    return pd.DataFrame([row for chunk in chunks for row in chunk])
 
 
 def main():
@@ -179,17 +201,14 @@ def main():
     print(f"\n👥 Creating ~{fencers_per_club} fencers per club...")
     fencers_df = create_fencers(clubs_df, fencers_per_club)
     
-    # Calculate actual bracket from age for verification
-    def calc_bracket(dob):
-        age = (date.today() - dob).days // 365
-        if age <= 10: return "U11"
-        elif age <= 12: return "U13"
-        elif age <= 14: return "U15"
-        elif age <= 16: return "Cadet"
-        elif age <= 19: return "Junior"
-        else: return "Senior"
-    
-    fencers_df['bracket'] = fencers_df['dob'].apply(calc_bracket)
+    # Calculate actual bracket from age for verification (vectorized - pd.cut
+    # buckets all rows at once instead of calling a Python function per row)
+    ages = (pd.Timestamp(date.today()) - pd.to_datetime(fencers_df['dob'])).dt.days // 365
+    fencers_df['bracket'] = pd.cut(
+        ages,
+        bins=[-1, 10, 12, 14, 16, 19, 200],
+        labels=["U11", "U13", "U15", "Cadet", "Junior", "Senior"]
+    )
     
     # Save to CSV
     csv_dir = os.path.join(os.path.dirname(__file__), "csv")
@@ -198,9 +217,15 @@ def main():
     clubs_path = os.path.join(csv_dir, "realistic_clubs.csv")
     fencers_path = os.path.join(csv_dir, "realistic_fencers.csv")
     
-    clubs_df.to_csv(clubs_path, index=False)
-    fencers_df.to_csv(fencers_path, index=False)
-    
+    write_csv(clubs_df, clubs_path)
+    write_csv(fencers_df, fencers_path)
+
+    # Also write Parquet - columnar binary with compression, much smaller and
+    # faster for Python consumers. CSV is kept for the existing ingest scripts.
+    if pa is not None:
+        clubs_df.to_parquet(clubs_path.replace('.csv', '.parquet'), compression='snappy')
+        fencers_df.to_parquet(fencers_path.replace('.csv', '.parquet'), compression='snappy')
+
     print(f"\n✅ Saved clubs to: {clubs_path}")
     print(f"✅ Saved fencers to: {fencers_path}")
     
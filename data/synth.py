@@ -1,8 +1,35 @@
 import pandas as pd
 import numpy as np
-from faker import Faker
+from faker.providers.person.en_US import Provider as _PersonProvider
 from datetime import date, timedelta
-import random 
+import random
+import os
+
+# Raw name pools from faker's en_US person provider. Sampling these
+# directly with random.choices bypasses faker's weighted-choice and
+# formatting machinery, which dominates per-name generation cost.
+FIRST_NAMES_MALE = list(_PersonProvider.first_names_male)
+FIRST_NAMES_FEMALE = list(_PersonProvider.first_names_female)
+LAST_NAMES = list(_PersonProvider.last_names)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+
+def write_csv(df, path):
+    """
+    Write a DataFrame to CSV using PyArrow's parallel writer when available.
+
+    PyArrow writes CSV several times faster than pandas' to_csv.
+    Falls back to pandas if pyarrow is not installed.
+    """
+    if pa is not None:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    else:
+        df.to_csv(path, index=False)
 
 def fake_name(gender: bool):
     """ 
@@ -16,13 +43,10 @@ def fake_name(gender: bool):
     if gender > 1 or gender < 0:
         raise ValueError("gender needs to be a boolean value")
 
-
-    fake = Faker()
-
     if gender == 0:
-        return fake.name_female()
+        return f"{random.choice(FIRST_NAMES_FEMALE)} {random.choice(LAST_NAMES)}"
     else:
-        return fake.name_male()
+        return f"{random.choice(FIRST_NAMES_MALE)} {random.choice(LAST_NAMES)}"
     
 def fake_dob(min_age=18, max_age=90):
     today = date.today()
@@ -32,26 +56,32 @@ def fake_dob(min_age=18, max_age=90):
     random_days = random.randint(0, (end_date - start_date).days)
     return start_date + timedelta(days=random_days)
 
+# Age ranges for each bracket
+BRACKET_AGES = {
+    "U11": (7, 10),
+    "U13": (11, 12),
+    "U15": (13, 14),
+    "Cadet": (15, 16),
+    "Junior": (17, 19),
+    "Senior": (20, 65)
+}
+
+# Precompute (window start, span in days) per bracket once at import.
+# fake_dob_for_bracket is called thousands of times, so rebuilding the
+# ages dict and calling date.today() per call was pure overhead.
+_BRACKET_RANGES = {
+    bracket: (
+        date.today() - timedelta(days=max_age * 365 + 364),
+        (max_age - min_age) * 365 + 364,
+    )
+    for bracket, (min_age, max_age) in BRACKET_AGES.items()
+}
+
+
 def fake_dob_for_bracket(bracket: str):
     """Generate DOB for specific age bracket"""
-    today = date.today()
-    
-    # Age ranges for each bracket
-    bracket_ages = {
-        "U11": (7, 10),
-        "U13": (11, 12),
-        "U15": (13, 14),
-        "Cadet": (15, 16),
-        "Junior": (17, 19),
-        "Senior": (20, 65)
-    }
-    
-    min_age, max_age = bracket_ages.get(bracket, (20, 65))
-    start_date = today - timedelta(days=max_age * 365 + 364)
-    end_date = today - timedelta(days=min_age * 365)
-    
-    random_days = random.randint(0, (end_date - start_date).days)
-    return start_date + timedelta(days=random_days)
+    start_date, span_days = _BRACKET_RANGES.get(bracket, _BRACKET_RANGES["Senior"])
+    return start_date + timedelta(days=random.randint(0, span_days))
 
 used_ids = set()
 id_map = {}
@@ -109,59 +139,68 @@ def create_d(n: int, club_no: int):
                 # Add extra fencer for first 'remainder' combinations
                 count = fencers_per_combo + (1 if combo_index < remainder else 0)
                 combo_index += 1
-                
-                for _ in range(count):
+
+                # Draw all club assignments and name parts for this combo in
+                # batch calls instead of per-fencer random.choice / faker calls
+                first_pool = FIRST_NAMES_MALE if gender == 1 else FIRST_NAMES_FEMALE
+                firsts = random.choices(first_pool, k=count)
+                lasts = random.choices(LAST_NAMES, k=count)
+                club_picks = random.choices(clubs, k=count)
+
+                for club, first_name, last_name in zip(club_picks, firsts, lasts):
                     # Generate unique fencer_id
                     uid = random.randint(0, 99999)
                     while uid in used_id:
                         uid = random.randint(0, 99999)
                     used_id.add(uid)
-                    
+
                     res["fencer_id"].append(uid)
-                    
-                    # Generate name based on gender
-                    uname = fake_name(gender).split()
-                    res["first_name"].append(uname[0])
-                    res["last_name"].append(uname[1])
+                    res["first_name"].append(first_name)
+                    res["last_name"].append(last_name)
                     
                     # Generate DOB for specific bracket
                     res["dob"].append(fake_dob_for_bracket(bracket))
                     
                     res["gender"].append(gender)
                     res["weapon"].append(weapon)
-                    res["club_id"].append(random.choice(clubs))
+                    res["club_id"].append(club)
 
     df = pd.DataFrame(res)
     return df
 
 
-# running - Generate 3600 fencers for perfect distribution
-# 3600 = 100 fencers per combination (6 brackets × 3 weapons × 2 genders)
-df = create_d(3600, 5)
-
-# Save to csv directory
-import os
-csv_dir = os.path.join(os.path.dirname(__file__), "csv")
-os.makedirs(csv_dir, exist_ok=True)
-csv_path = os.path.join(csv_dir, "synth_data.csv")
-df.to_csv(csv_path, index=False)
-print(f"Saved synthetic data to: {csv_path}")
-print(f"Total fencers: {len(df)}")
-print("\nDistribution by bracket:")
-# Calculate bracket from ages for verification
-from datetime import date
-def calc_bracket(dob):
-    age = (date.today() - dob).days // 365
-    if age <= 10: return "U11"
-    elif age <= 12: return "U13"
-    elif age <= 14: return "U15"
-    elif age <= 16: return "Cadet"
-    elif age <= 19: return "Junior"
-    else: return "Senior"
-
-df['bracket'] = df['dob'].apply(calc_bracket)
-print(df.groupby(['bracket', 'weapon', 'gender']).size().unstack(fill_value=0))
-print(f"\nFencers per bracket: {df['bracket'].value_counts().sort_index()}")
+def main():
+    """Generate 3600 fencers (100 per bracket/weapon/gender combination) and save to CSV"""
+    df = create_d(3600, 5)
+
+    # Save to csv directory
+    csv_dir = os.path.join(os.path.dirname(__file__), "csv")
+    os.makedirs(csv_dir, exist_ok=True)
+    csv_path = os.path.join(csv_dir, "synth_data.csv")
+    write_csv(df, csv_path)
+    # Also write Parquet - columnar binary with compression, much smaller and
+    # faster for Python consumers. CSV is kept for the existing ingest scripts.
+    if pa is not None:
+        df.to_parquet(csv_path.replace('.csv', '.parquet'), compression='snappy')
+    print(f"Saved synthetic data to: {csv_path}")
+    print(f"Total fencers: {len(df)}")
+    print("\nDistribution by bracket:")
+    # Calculate bracket from ages for verification (vectorized - pd.cut buckets
+    # all rows at once instead of calling a Python function per row)
+    ages = (pd.Timestamp(date.today()) - pd.to_datetime(df['dob'])).dt.days // 365
+    df['bracket'] = pd.cut(
+        ages,
+        bins=[-1, 10, 12, 14, 16, 19, 200],
+        labels=["U11", "U13", "U15", "Cadet", "Junior", "Senior"]
+    )
+    print(df.groupby(['bracket', 'weapon', 'gender']).size().unstack(fill_value=0))
+    print(f"\nFencers per bracket: {df['bracket'].value_counts().sort_index()}")
+
+
+# Guarded so importing this module for its helpers (fake_dob_for_bracket,
+# write_csv, ...) doesn't trigger a full generation run + CSV write
+if __name__ == "__main__":
+    main()
 
 
 